@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for the Deploy Server backend
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5001)}"
+workers = int(os.getenv('GUNICORN_WORKERS', 4))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Build the app once in the master (extensions, db.create_all) so workers
+# start ready to serve instead of racing through initialization
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master"""
+    from app import app
+    from models import db
+    
+    with app.app_context():
+        db.engine.dispose(close=False)
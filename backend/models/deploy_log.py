@@ -2,6 +2,7 @@
 Deploy log model for tracking deployment history
 """
 from datetime import datetime, timezone, timedelta
+from sqlalchemy.orm import joinedload
 from . import db
 
 class DeployLog(db.Model):
@@ -10,7 +11,7 @@ class DeployLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # Foreign keys
-    server_id = db.Column(db.Integer, db.ForeignKey('servers.id'), nullable=False, index=True)
+    server_id = db.Column(db.Integer, db.ForeignKey('servers.id'), nullable=False)
     executed_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
     
     # Deployment details
@@ -36,10 +37,21 @@ class DeployLog(db.Model):
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), 
                           onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     
-    def complete_deployment(self, status, output=None, error_message=None):
-        """Mark deployment as completed"""
+    # Indexes
+    __table_args__ = (
+        # Per-server history is filtered on server_id and ordered by created_at
+        db.Index('ix_deploy_logs_server_created_at', 'server_id', 'created_at'),
+    )
+    
+    def complete_deployment(self, status, output=None, error_message=None, commit=True):
+        """Mark deployment as completed
+        
+        Pass commit=False to flush this together with a following server
+        status update in one transaction.
+        """
         self.status = status
-        self.completed_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        self.completed_at = now
         self.duration = int((self.completed_at - self.started_at).total_seconds())
         
         if output:
@@ -47,8 +59,9 @@ class DeployLog(db.Model):
         if error_message:
             self.error_message = error_message
             
-        self.updated_at = datetime.now(timezone.utc)
-        db.session.commit()
+        self.updated_at = now
+        if commit:
+            db.session.commit()
     
     def update_output(self, output, append=True):
         """Update deployment output"""
@@ -112,7 +125,7 @@ class DeployLog(db.Model):
             data['error_message'] = self.error_message
             
         # Include related data
-        if hasattr(self, 'server') and self.server:
+        if self.server:
             data['server'] = {
                 'id': self.server.id,
                 'alias': self.server.alias,
@@ -120,7 +133,7 @@ class DeployLog(db.Model):
                 'ip': self.server.ip
             }
             
-        if hasattr(self, 'executed_by_user') and self.executed_by_user:
+        if self.executed_by_user:
             data['executed_by_user'] = {
                 'id': self.executed_by_user.id,
                 'username': self.executed_by_user.username
@@ -128,10 +141,18 @@ class DeployLog(db.Model):
             
         return data
     
+    @classmethod
+    def query_with_relations(cls):
+        """Query that eager-loads the server and user rendered by to_dict"""
+        return cls.query.options(
+            joinedload(cls.server),
+            joinedload(cls.executed_by_user)
+        )
+    
     @classmethod
     def get_recent_logs(cls, limit=50, server_id=None, status=None):
         """Get recent deployment logs with optional filters"""
-        query = cls.query
+        query = cls.query_with_relations()
         
         if server_id:
             query = query.filter_by(server_id=server_id)
@@ -143,20 +164,20 @@ class DeployLog(db.Model):
     @classmethod
     def get_deployment_stats(cls, server_id=None, days=30):
         """Get deployment statistics"""
-        from sqlalchemy import func
-        
-        query = cls.query
+        query = db.session.query(
+            db.func.count(cls.id),
+            db.func.count(cls.id).filter(cls.status == 'success'),
+            db.func.count(cls.id).filter(cls.status == 'error'),
+            db.func.count(cls.id).filter(cls.status == 'running')
+        )
         if server_id:
-            query = query.filter_by(server_id=server_id)
+            query = query.filter(cls.server_id == server_id)
             
         # Filter by date range
         since_date = datetime.now(timezone.utc) - timedelta(days=days)
         query = query.filter(cls.created_at >= since_date)
         
-        total = query.count()
-        successful = query.filter_by(status='success').count()
-        failed = query.filter_by(status='error').count()
-        running = query.filter_by(status='running').count()
+        total, successful, failed, running = query.one()
         
         return {
             'total': total,
@@ -181,4 +202,4 @@ class DeployLog(db.Model):
         return log
     
     def __repr__(self):
-        return f'<DeployLog {self.id} - {self.server.alias if hasattr(self, "server") else self.server_id} - {self.status}>'
+        return f'<DeployLog {self.id} - {self.server.alias if self.server else self.server_id} - {self.status}>'
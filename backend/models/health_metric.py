@@ -1,7 +1,7 @@
 """
 Health metric model for server monitoring
 """
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from . import db
 
 class HealthMetric(db.Model):
@@ -10,7 +10,7 @@ class HealthMetric(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # Foreign key
-    server_id = db.Column(db.Integer, db.ForeignKey('servers.id'), nullable=False, index=True)
+    server_id = db.Column(db.Integer, db.ForeignKey('servers.id'), nullable=False)
     
     # Health metrics
     ping_time = db.Column(db.Float, nullable=True)  # Ping response time in ms
@@ -39,6 +39,11 @@ class HealthMetric(db.Model):
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), 
                           onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     
+    __table_args__ = (
+        # Per-server history and summaries filter on server_id and a created_at range
+        db.Index('ix_health_metrics_server_created_at', 'server_id', 'created_at'),
+    )
+    
     def determine_status(self):
         """Automatically determine health status based on metrics"""
         if self.error_message:
@@ -139,31 +144,30 @@ class HealthMetric(db.Model):
     @classmethod
     def get_server_health_summary(cls, server_id, hours=24):
         """Get health summary for a server"""
-        from sqlalchemy import func
-        from datetime import timedelta
-        
         since_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         
-        metrics = cls.query.filter(
-            cls.server_id == server_id,
-            cls.created_at >= since_time
-        ).all()
+        in_window = (cls.server_id == server_id, cls.created_at >= since_time)
         
-        if not metrics:
-            return None
+        # Averages are computed in SQL; zero readings are ignored as before
+        total_metrics, avg_cpu, avg_memory, avg_disk, avg_ping = db.session.query(
+            db.func.count(cls.id),
+            db.func.avg(db.func.nullif(cls.cpu_usage, 0)),
+            db.func.avg(db.func.nullif(cls.memory_usage, 0)),
+            db.func.avg(db.func.nullif(cls.disk_usage, 0)),
+            db.func.avg(db.func.nullif(cls.ping_time, 0))
+        ).filter(*in_window).one()
         
-        # Calculate averages
-        total_metrics = len(metrics)
-        avg_cpu = sum(m.cpu_usage for m in metrics if m.cpu_usage) / len([m for m in metrics if m.cpu_usage]) if any(m.cpu_usage for m in metrics) else None
-        avg_memory = sum(m.memory_usage for m in metrics if m.memory_usage) / len([m for m in metrics if m.memory_usage]) if any(m.memory_usage for m in metrics) else None
-        avg_disk = sum(m.disk_usage for m in metrics if m.disk_usage) / len([m for m in metrics if m.disk_usage]) if any(m.disk_usage for m in metrics) else None
-        avg_ping = sum(m.ping_time for m in metrics if m.ping_time) / len([m for m in metrics if m.ping_time]) if any(m.ping_time for m in metrics) else None
+        if not total_metrics:
+            return None
         
         # Count status occurrences
-        status_counts = {}
-        for metric in metrics:
-            status = metric.status
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = dict(
+            db.session.query(cls.status, db.func.count(cls.id))
+            .filter(*in_window)
+            .group_by(cls.status)
+            .all()
+        )
+        latest_metric = cls.query.filter(*in_window).order_by(db.desc(cls.created_at)).first()
         
         return {
             'total_checks': total_metrics,
@@ -172,7 +176,7 @@ class HealthMetric(db.Model):
             'avg_disk_usage': round(avg_disk, 2) if avg_disk else None,
             'avg_ping_time': round(avg_ping, 2) if avg_ping else None,
             'status_distribution': status_counts,
-            'latest_metric': metrics[0].to_dict() if metrics else None
+            'latest_metric': latest_metric.to_dict()
         }
     
     @classmethod
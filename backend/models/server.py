@@ -2,7 +2,9 @@
 Server model for managing deployment targets
 """
 from datetime import datetime, timezone
+from sqlalchemy.orm import defer, joinedload
 from . import db
+from .deploy_log import DeployLog
 
 class Server(db.Model):
     __tablename__ = 'servers'
@@ -46,6 +48,8 @@ class Server(db.Model):
     __table_args__ = (
         db.UniqueConstraint('ip', 'ssh_port', name='unique_server_endpoint'),
         db.UniqueConstraint('alias', name='unique_server_alias'),
+        # Server lists only look at active servers
+        db.Index('ix_servers_active_created_at', 'created_at', postgresql_where=db.text('is_active')),
     )
     
     def update_status(self, status):
@@ -56,19 +60,45 @@ class Server(db.Model):
     
     def update_last_deployed(self):
         """Update last deployed timestamp"""
-        self.last_deployed = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        self.last_deployed = now
+        self.updated_at = now
+        db.session.commit()
+    
+    def mark_deployed(self):
+        """Set server online with a fresh last deployed timestamp in one commit"""
+        now = datetime.now(timezone.utc)
+        self.status = 'online'
+        self.last_deployed = now
+        self.updated_at = now
         db.session.commit()
     
     def update_last_health_check(self):
         """Update last health check timestamp"""
-        self.last_health_check = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        self.last_health_check = now
+        self.updated_at = now
         db.session.commit()
     
-    def get_recent_deploys(self, limit=10):
-        """Get recent deployment logs"""
-        return self.deploy_logs.order_by(
+    def update_health_status(self, status):
+        """Record a health check result and status in a single commit"""
+        now = datetime.now(timezone.utc)
+        self.status = status
+        self.last_health_check = now
+        self.updated_at = now
+        db.session.commit()
+    
+    def get_recent_deploys(self, limit=10, include_output=True):
+        """Get recent deployment logs
+        
+        With include_output=False the potentially large output and
+        error_message columns are not fetched.
+        """
+        # to_dict renders the executing user, load it with the logs
+        query = self.deploy_logs.options(joinedload(DeployLog.executed_by_user))
+        if not include_output:
+            query = query.options(defer(DeployLog.output), defer(DeployLog.error_message))
+        return query.order_by(
             db.desc('created_at')
         ).limit(limit).all()
     
@@ -108,7 +138,10 @@ class Server(db.Model):
         }
         
         if include_relations:
-            data['recent_deploys'] = [deploy.to_dict() for deploy in self.get_recent_deploys(5)]
+            data['recent_deploys'] = [
+                deploy.to_dict(include_output=False)
+                for deploy in self.get_recent_deploys(5, include_output=False)
+            ]
             latest_health = self.get_latest_health_metric()
             data['latest_health'] = latest_health.to_dict() if latest_health else None
             
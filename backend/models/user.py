@@ -1,10 +1,30 @@
 """
 User model for authentication and authorization
 """
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timedelta, timezone
 from werkzeug.security import generate_password_hash, check_password_hash
 from . import db
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    argon2_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+except ImportError:
+    argon2_hasher = None
+
+# Password KDF used for new hashes: "argon2" (needs argon2-cffi) or a werkzeug
+# method string such as "scrypt" or "pbkdf2:sha256:600000". Stored hashes carry
+# their own method prefix, so changing this only affects passwords set afterwards.
+PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'scrypt')
+if PASSWORD_HASH_METHOD == 'argon2' and argon2_hasher is None:
+    # argon2-cffi is not installed; keep hashing with werkzeug's scrypt
+    PASSWORD_HASH_METHOD = 'scrypt'
+
+# Logins closer together than this reuse the stored last_login instead of
+# writing the users row again
+LAST_LOGIN_WRITE_INTERVAL = timedelta(seconds=int(os.getenv('LAST_LOGIN_WRITE_INTERVAL', 60)))
+
 class User(db.Model):
     __tablename__ = 'users'
     
@@ -30,12 +50,34 @@ class User(db.Model):
     
     def set_password(self, password):
         """Set password hash"""
-        self.password_hash = generate_password_hash(password)
+        if PASSWORD_HASH_METHOD == 'argon2':
+            self.password_hash = argon2_hasher.hash(password)
+        else:
+            self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
     
     def check_password(self, password):
         """Check password against hash"""
+        if self.password_hash.startswith('$argon2'):
+            if not argon2_hasher:
+                return False
+            try:
+                return argon2_hasher.verify(self.password_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
         return check_password_hash(self.password_hash, password)
     
+    def needs_rehash(self):
+        """Check if the stored hash should be upgraded to the configured Argon2 parameters
+        
+        Only applies when PASSWORD_HASH_METHOD is argon2: legacy scrypt/pbkdf2
+        hashes and Argon2 hashes with outdated parameters are migrated on login.
+        """
+        if PASSWORD_HASH_METHOD != 'argon2':
+            return False
+        if not self.password_hash.startswith('$argon2'):
+            return True
+        return argon2_hasher.check_needs_rehash(self.password_hash)
+    
     def is_admin(self):
         """Check if user is admin"""
         return self.role == 'admin'
@@ -45,8 +87,22 @@ class User(db.Model):
         return self.role in ['admin', 'user']
     
     def update_last_login(self):
-        """Update last login timestamp"""
-        self.last_login = datetime.now(timezone.utc)
+        """Update last login timestamp, skipping the write for rapid re-logins
+        
+        The throttle runs in the database against now(), so it compares values
+        in the column's own (session) timezone rather than against UTC.
+        """
+        cls = type(self)
+        db.session.execute(
+            db.update(cls)
+            .where(
+                cls.id == self.id,
+                db.or_(cls.last_login.is_(None),
+                       cls.last_login < db.func.now() - LAST_LOGIN_WRITE_INTERVAL)
+            )
+            .values(last_login=db.func.now()),
+            execution_options={'synchronize_session': False}
+        )
         db.session.commit()
     
     def to_dict(self, include_sensitive=False):
@@ -67,6 +123,11 @@ class User(db.Model):
             
         return data
     
+    @classmethod
+    def find_by_id(cls, user_id):
+        """Find user by ID (served from the session identity map when already loaded)"""
+        return db.session.get(cls, user_id)
+    
     @classmethod
     def find_by_username(cls, username):
         """Find user by username"""
@@ -1,8 +1,10 @@
 from flask_restx import Namespace, Resource, fields
 from flask import request
+from werkzeug.exceptions import HTTPException
+from sqlalchemy.exc import IntegrityError
 from flask_jwt_extended import jwt_required, get_jwt_identity, create_access_token, create_refresh_token
+from models import db
 from models.user import User
-from utils.auth import check_password, hash_password
 from utils.rate_limit import limiter
 import logging
 from datetime import timedelta
@@ -55,7 +57,7 @@ class Login(Resource):
     def post(self):
         """User login"""
         try:
-            data = request.get_json()
+            data = request.get_json(silent=True) or {}
             username = data.get('username')
             password = data.get('password')
             
@@ -64,9 +66,14 @@ class Login(Resource):
             
             # Find user
             user = User.find_by_username(username)
-            if not user or not check_password(password, user.password_hash):
+            if not user or not user.check_password(password):
                 auth_ns.abort(401, "Invalid credentials")
             
+            # Migrate legacy or outdated hashes while the plaintext is at hand
+            if user.needs_rehash():
+                user.set_password(password)
+                db.session.commit()
+            
             # Update last login
             user.update_last_login()
             
@@ -87,6 +94,8 @@ class Login(Resource):
                 'expires_in': 3600
             }
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Login error: {str(e)}")
             auth_ns.abort(500, f"Login failed: {str(e)}")
@@ -100,7 +109,7 @@ class Register(Resource):
     def post(self):
         """User registration"""
         try:
-            data = request.get_json()
+            data = request.get_json(silent=True) or {}
             
             # Validate required fields
             username = data.get('username')
@@ -111,29 +120,23 @@ class Register(Resource):
             if not username or not password or not email:
                 auth_ns.abort(400, "Username, password, and email are required")
             
-            # Check if user already exists
-            if User.find_by_username(username):
-                auth_ns.abort(400, "Username already exists")
-            
-            if User.find_by_email(email):
-                auth_ns.abort(400, "Email already exists")
-            
-            # Create user
-            user = User.create_user(
-                username=username,
-                password=password,
-                email=email,
-                role=role
-            )
-            
-            return {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'role': user.role,
-                'created_at': user.created_at
-            }, 201
-            
+            # Create user; the unique username/email constraints reject duplicates
+            try:
+                user = User.create_user(
+                    username=username,
+                    password=password,
+                    email=email,
+                    role=role
+                )
+            except IntegrityError:
+                db.session.rollback()
+                auth_ns.abort(400, "Username or email already exists")
+            
+            # marshal_with(user_info_model) reads the fields straight off the model
+            return user, 201
+            
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Registration error: {str(e)}")
             auth_ns.abort(500, f"Registration failed: {str(e)}")
@@ -178,15 +181,11 @@ class UserProfile(Resource):
             if not user:
                 auth_ns.abort(404, "User not found")
             
-            return {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'role': user.role,
-                'created_at': user.created_at,
-                'last_login': user.last_login
-            }
+            # marshal_with(user_info_model) reads the fields straight off the model
+            return user
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Profile error: {str(e)}")
             auth_ns.abort(500, f"Failed to get profile: {str(e)}")
@@ -200,7 +199,7 @@ class ChangePassword(Resource):
         """Change user password"""
         try:
             current_user_id = get_jwt_identity()
-            data = request.get_json()
+            data = request.get_json(silent=True) or {}
             
             current_password = data.get('current_password')
             new_password = data.get('new_password')
@@ -213,15 +212,17 @@ class ChangePassword(Resource):
                 auth_ns.abort(404, "User not found")
             
             # Verify current password
-            if not check_password(current_password, user.password_hash):
+            if not user.check_password(current_password):
                 auth_ns.abort(400, "Current password is incorrect")
             
             # Update password
-            user.password_hash = hash_password(new_password)
-            user.save()
+            user.set_password(new_password)
+            db.session.commit()
             
             return {"message": "Password changed successfully"}
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Password change error: {str(e)}")
             auth_ns.abort(500, f"Password change failed: {str(e)}")
@@ -116,7 +116,7 @@ class ServerList(Resource):
             current_user_id = get_jwt_identity()
             
             # Validate input data
-            data = request.get_json()
+            data = request.get_json(silent=True) or {}
             try:
                 server_data = ServerCreateSchema(**data)
             except Exception as e:
@@ -182,7 +182,7 @@ class ServerDetail(Resource):
             current_user_id = get_jwt_identity()
             
             # Validate input data
-            data = request.get_json()
+            data = request.get_json(silent=True) or {}
             try:
                 server_data = ServerUpdateSchema(**data)
             except Exception as e:
@@ -7,6 +7,16 @@ from datetime import datetime
 import re
 
 
+# Validation patterns and choices, compiled once at import
+IPV4_PATTERN = re.compile(
+    r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
+    r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
+)
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+VALID_ENVIRONMENTS = ('production', 'staging', 'development')
+VALID_ROLES = ('admin', 'user', 'viewer')
+
+
 class BaseResponseModel(BaseModel):
     """Base response model for all API responses"""
     success: bool
@@ -28,19 +38,14 @@ class ServerCreateSchema(BaseModel):
     @validator('ip')
     def validate_ip(cls, v):
         # Basic IPv4 validation
-        ip_pattern = re.compile(
-            r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-        )
-        if not ip_pattern.match(v):
+        if not IPV4_PATTERN.match(v):
             raise ValueError('Invalid IP address format')
         return v
     
     @validator('environment')
     def validate_environment(cls, v):
-        valid_environments = ['production', 'staging', 'development']
-        if v not in valid_environments:
-            raise ValueError(f'Environment must be one of: {", ".join(valid_environments)}')
+        if v not in VALID_ENVIRONMENTS:
+            raise ValueError(f'Environment must be one of: {", ".join(VALID_ENVIRONMENTS)}')
         return v
 
 
@@ -59,20 +64,15 @@ class ServerUpdateSchema(BaseModel):
     @validator('ip')
     def validate_ip(cls, v):
         if v is not None:
-            ip_pattern = re.compile(
-                r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
-                r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-            )
-            if not ip_pattern.match(v):
+            if not IPV4_PATTERN.match(v):
                 raise ValueError('Invalid IP address format')
         return v
     
     @validator('environment')
     def validate_environment(cls, v):
         if v is not None:
-            valid_environments = ['production', 'staging', 'development']
-            if v not in valid_environments:
-                raise ValueError(f'Environment must be one of: {", ".join(valid_environments)}')
+            if v not in VALID_ENVIRONMENTS:
+                raise ValueError(f'Environment must be one of: {", ".join(VALID_ENVIRONMENTS)}')
         return v
 
 
@@ -127,16 +127,14 @@ class UserCreateSchema(BaseModel):
     
     @validator('role')
     def validate_role(cls, v):
-        valid_roles = ['admin', 'user', 'viewer']
-        if v not in valid_roles:
-            raise ValueError(f'Role must be one of: {", ".join(valid_roles)}')
+        if v not in VALID_ROLES:
+            raise ValueError(f'Role must be one of: {", ".join(VALID_ROLES)}')
         return v
     
     @validator('email')
     def validate_email(cls, v):
         if v is not None:
-            email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-            if not email_pattern.match(v):
+            if not EMAIL_PATTERN.match(v):
                 raise ValueError('Invalid email format')
         return v
 
@@ -35,9 +35,12 @@ class DeploymentService:
         Returns:
             Dict containing deployment result
         """
+        server = None
+        deploy_log = None
+        
         try:
             # Get server from database
-            server = Server.query.get(server_id)
+            server = db.session.get(Server, server_id)
             if not server:
                 raise ValueError(f"Server with ID {server_id} not found")
             
@@ -59,7 +62,7 @@ class DeploymentService:
             # Update server status
             server.update_status('deploying')
             
-            logger.info(f"Starting deployment to {server.alias} ({server.ip})")
+            logger.info("Starting deployment to {} ({})", server.alias, server.ip)
             
             # Execute deployment
             result = self._execute_deployment(server, deploy_log)
@@ -68,16 +71,17 @@ class DeploymentService:
             if result['success']:
                 deploy_log.complete_deployment(
                     status='success',
-                    output=result['output']
+                    output=result['output'],
+                    commit=False
                 )
-                server.update_status('online')
-                server.update_last_deployed()
-                logger.info(f"Deployment to {server.alias} completed successfully")
+                server.mark_deployed()
+                logger.info("Deployment to {} completed successfully", server.alias)
             else:
                 deploy_log.complete_deployment(
                     status='error',
                     output=result['output'],
-                    error_message=result['error']
+                    error_message=result['error'],
+                    commit=False
                 )
                 server.update_status('error')
                 logger.error(f"Deployment to {server.alias} failed: {result['error']}")
@@ -97,15 +101,18 @@ class DeploymentService:
         except Exception as e:
             logger.error(f"Deployment error: {str(e)}")
             
+            # The session may be unusable (e.g. the backend was terminated)
+            db.session.rollback()
+            
             # Update server status if deployment log exists
-            if 'deploy_log' in locals():
+            if deploy_log is not None:
                 deploy_log.complete_deployment(
                     status='error',
                     error_message=str(e)
                 )
             
             # Reset server status
-            if 'server' in locals():
+            if server is not None:
                 server.update_status('error')
             
             return {
@@ -126,30 +133,42 @@ class DeploymentService:
             Dict containing execution result
         """
         output_lines = []
+        flushed_lines = 0
+        
+        def flush_output():
+            # Append only the lines not yet written to the deploy log
+            nonlocal flushed_lines
+            deploy_log.update_output('\n'.join(output_lines[flushed_lines:]))
+            flushed_lines = len(output_lines)
         
         try:
+            # Copy what the SSH session needs before the first commit expires
+            # the instances; reading them afterwards would open a refresh
+            # transaction that sits idle through the handshake and the command
+            ip, ssh_port, ssh_user = server.ip, server.ssh_port, server.user
+            command = deploy_log.command or server.script_path
+            
             # Create SSH client
             ssh_client = paramiko.SSHClient()
             ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             
             # Connect to server
-            output_lines.append(f"Connecting to {server.user}@{server.ip}:{server.ssh_port}")
-            deploy_log.update_output('\n'.join(output_lines))
+            output_lines.append(f"Connecting to {ssh_user}@{ip}:{ssh_port}")
+            flush_output()
             
             ssh_client.connect(
-                hostname=server.ip,
-                port=server.ssh_port,
-                username=server.user,
+                hostname=ip,
+                port=ssh_port,
+                username=ssh_user,
                 timeout=self.ssh_timeout
             )
             
             output_lines.append("SSH connection established")
-            deploy_log.update_output('\n'.join(output_lines))
+            flush_output()
             
             # Execute deployment script
-            command = deploy_log.command or server.script_path
             output_lines.append(f"Executing: {command}")
-            deploy_log.update_output('\n'.join(output_lines))
+            flush_output()
             
             stdin, stdout, stderr = ssh_client.exec_command(command, timeout=self.max_deploy_time)
             
@@ -161,7 +180,7 @@ class DeploymentService:
                 output_lines.append(line.strip())
                 # Update deploy log periodically
                 if len(output_lines) % 10 == 0:
-                    deploy_log.update_output('\n'.join(output_lines))
+                    flush_output()
             
             # Get exit code
             exit_code = stdout.channel.recv_exit_status()
@@ -209,6 +228,9 @@ class DeploymentService:
             }
             
         except Exception as e:
+            # A failed output flush leaves the session needing a rollback
+            # before the caller records the result
+            db.session.rollback()
             error_msg = f"Deployment execution error: {str(e)}"
             output_lines.append(f"❌ {error_msg}")
             return {
@@ -265,7 +287,7 @@ class DeploymentService:
             Dict containing cancellation result
         """
         try:
-            deploy_log = DeployLog.query.get(deploy_log_id)
+            deploy_log = db.session.get(DeployLog, deploy_log_id)
             if not deploy_log:
                 raise ValueError(f"Deployment log with ID {deploy_log_id} not found")
             
@@ -275,14 +297,15 @@ class DeploymentService:
             # Mark as cancelled
             deploy_log.complete_deployment(
                 status='cancelled',
-                error_message=f"Cancelled by user {user_id}" if user_id else "Cancelled"
+                error_message=f"Cancelled by user {user_id}" if user_id else "Cancelled",
+                commit=False
             )
             
             # Update server status
             server = deploy_log.server
             server.update_status('online')
             
-            logger.info(f"Deployment {deploy_log_id} cancelled")
+            logger.info("Deployment {} cancelled", deploy_log_id)
             
             return {
                 'success': True,
@@ -2,9 +2,14 @@
 Health monitoring service for server health checks
 """
 import os
+import platform
 import socket
 import subprocess
+import time
+import paramiko
 import psutil
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from ping3 import ping
@@ -15,47 +20,91 @@ from models.server import Server
 from models.health_metric import HealthMetric
 
 
+# Remote system probes: (metric field, shell command, value type)
+SYSTEM_METRIC_COMMANDS = (
+    ('cpu_usage', "top -bn1 | grep 'Cpu(s)' | awk '{print $2}' | cut -d'%' -f1", float),
+    ('memory_usage', "free | grep Mem | awk '{printf \"%.2f\", $3/$2 * 100.0}'", float),
+    ('disk_usage', "df -h / | awk 'NR==2 {print $5}' | cut -d'%' -f1", float),
+    ('uptime', "cat /proc/uptime | awk '{print int($1)}'", int),
+    ('load_average', "cat /proc/loadavg | awk '{print $1}'", float),
+)
+
+# Network probes are I/O bound; run them side by side instead of back to back
+HEALTH_PROBE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv('HEALTH_PROBE_WORKERS', 8)),
+    thread_name_prefix='health-probe'
+)
+
+# Fan-out for bulk checks; kept separate from HEALTH_PROBE_POOL because each
+# task waits on probes submitted there
+SERVER_CHECK_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv('HEALTH_CHECK_WORKERS', 8)),
+    thread_name_prefix='health-check'
+)
+
+# Host descriptors that stay constant for the life of the process
+SYSTEM_INFO = {
+    'platform': platform.system(),
+    'architecture': platform.machine(),
+    'cpu_count': psutil.cpu_count(logical=True),
+}
+
+# cpu_percent(interval=None) reports usage since the previous call; prime it
+# so the first system health request does not read a meaningless 0.0
+psutil.cpu_percent(interval=None)
+
+
 class HealthService:
     """Service for monitoring server health"""
     
+    # Local system snapshot shared by all get_system_health callers
+    system_snapshot_ttl = float(os.getenv('SYSTEM_SNAPSHOT_TTL', 5))
+    _system_snapshot = None
+    _system_snapshot_at = 0.0
+    
     def __init__(self):
         self.ping_timeout = int(os.getenv('PING_TIMEOUT', 5))
         self.health_check_interval = int(os.getenv('HEALTH_CHECK_INTERVAL', 60))
     
-    def check_server_health(self, server_id: int, detailed: bool = True) -> Dict:
+    def check_server_health(self, server_id: int, detailed: bool = True,
+                            connectivity: Optional[Future] = None) -> Dict:
         """
         Perform comprehensive health check on a server
         
         Args:
             server_id: ID of the server to check
             detailed: Whether to perform detailed system metrics check
+            connectivity: Already submitted _check_connectivity probe to use
+                instead of probing here
             
         Returns:
             Dict containing health check results
         """
+        server = None
+        
         try:
             # Get server from database
-            server = Server.query.get(server_id)
+            server = db.session.get(Server, server_id)
             if not server:
                 raise ValueError(f"Server with ID {server_id} not found")
             
-            logger.info(f"Starting health check for {server.alias} ({server.ip})")
-            
-            # Perform health checks
-            health_data = {}
+            alias, ip, ssh_port, ssh_user = server.alias, server.ip, server.ssh_port, server.user
+            logger.info("Starting health check for {} ({})", alias, ip)
             
-            # Basic connectivity check (ping)
-            ping_result = self._check_ping(server.ip)
-            health_data.update(ping_result)
+            # End the read transaction so no connection sits idle in a
+            # transaction while the network probes run
+            db.session.commit()
             
-            # DNS resolution check
-            dns_result = self._check_dns_resolution(server.ip)
-            health_data.update(dns_result)
+            # Basic connectivity (ping) and DNS resolution checks
+            if connectivity is None:
+                health_data = self._check_connectivity(ip)
+            else:
+                health_data = connectivity.result()
             
             # If basic checks pass and detailed check is requested
-            if ping_result.get('ping_time') is not None and detailed:
+            if health_data.get('ping_time') is not None and detailed:
                 # SSH-based system metrics
-                system_metrics = self._get_system_metrics(server)
+                system_metrics = self._get_system_metrics(ip, ssh_port, ssh_user)
                 health_data.update(system_metrics)
             
             # Create health metric record
@@ -64,18 +113,11 @@ class HealthService:
                 **health_data
             )
             
-            # Update server's last health check time
-            server.update_last_health_check()
+            # Update server's last health check time and status together;
+            # servers with warnings are still online
+            server.update_health_status('offline' if health_metric.is_critical() else 'online')
             
-            # Update server status based on health
-            if health_metric.is_critical():
-                server.update_status('offline')
-            elif health_metric.is_warning():
-                server.update_status('online')  # Still online but with warnings
-            else:
-                server.update_status('online')
-            
-            logger.info(f"Health check completed for {server.alias}: {health_metric.status}")
+            logger.info("Health check completed for {}: {}", alias, health_metric.status)
             
             return {
                 'success': True,
@@ -89,6 +131,7 @@ class HealthService:
             
         except Exception as e:
             logger.error(f"Health check error for server {server_id}: {str(e)}")
+            db.session.rollback()
             
             # Create error health metric
             try:
@@ -99,7 +142,7 @@ class HealthService:
                 )
                 
                 # Update server status
-                if 'server' in locals():
+                if server is not None:
                     server.update_status('offline')
                 
                 return {
@@ -118,6 +161,22 @@ class HealthService:
                     'data': None
                 }
     
+    def _check_connectivity(self, ip: str) -> Dict:
+        """
+        Run the ping and DNS checks for an IP concurrently
+        
+        Args:
+            ip: Server IP address
+            
+        Returns:
+            Dict containing merged ping and DNS results
+        """
+        ping_future = HEALTH_PROBE_POOL.submit(self._check_ping, ip)
+        dns_future = HEALTH_PROBE_POOL.submit(self._check_dns_resolution, ip)
+        health_data = ping_future.result()
+        health_data.update(dns_future.result())
+        return health_data
+    
     def _check_ping(self, ip: str) -> Dict:
         """
         Check server connectivity using ping
@@ -177,77 +236,59 @@ class HealthService:
                 'error_message': f"DNS resolution error: {str(e)}"
             }
     
-    def _get_system_metrics(self, server: Server) -> Dict:
+    def _get_system_metrics(self, ip: str, ssh_port: int, user: str) -> Dict:
         """
         Get detailed system metrics via SSH
         
         Args:
-            server: Server model instance
+            ip: Server IP address
+            ssh_port: SSH port
+            user: SSH user
             
         Returns:
             Dict containing system metrics
         """
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        
         try:
-            import paramiko
-            
-            # Create SSH client
-            ssh_client = paramiko.SSHClient()
-            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
             # Connect to server
             ssh_client.connect(
-                hostname=server.ip,
-                port=server.ssh_port,
-                username=server.user,
-                timeout=self.ping_timeout
+                hostname=ip,
+                port=ssh_port,
+                username=user,
+                timeout=self.ping_timeout,
+                banner_timeout=self.ping_timeout,
+                auth_timeout=self.ping_timeout
             )
             
-            metrics = {}
-            
-            # Get CPU usage
-            cpu_command = "top -bn1 | grep 'Cpu(s)' | awk '{print $2}' | cut -d'%' -f1"
-            stdin, stdout, stderr = ssh_client.exec_command(cpu_command)
-            cpu_output = stdout.read().decode().strip()
-            if cpu_output and cpu_output.replace('.', '').isdigit():
-                metrics['cpu_usage'] = float(cpu_output)
-            
-            # Get memory usage
-            mem_command = "free | grep Mem | awk '{printf \"%.2f\", $3/$2 * 100.0}'"
-            stdin, stdout, stderr = ssh_client.exec_command(mem_command)
-            mem_output = stdout.read().decode().strip()
-            if mem_output and mem_output.replace('.', '').isdigit():
-                metrics['memory_usage'] = float(mem_output)
-            
-            # Get disk usage
-            disk_command = "df -h / | awk 'NR==2 {print $5}' | cut -d'%' -f1"
-            stdin, stdout, stderr = ssh_client.exec_command(disk_command)
-            disk_output = stdout.read().decode().strip()
-            if disk_output and disk_output.isdigit():
-                metrics['disk_usage'] = float(disk_output)
-            
-            # Get uptime
-            uptime_command = "cat /proc/uptime | awk '{print int($1)}'"
-            stdin, stdout, stderr = ssh_client.exec_command(uptime_command)
-            uptime_output = stdout.read().decode().strip()
-            if uptime_output and uptime_output.isdigit():
-                metrics['uptime'] = int(uptime_output)
-            
-            # Get load average
-            load_command = "cat /proc/loadavg | awk '{print $1}'"
-            stdin, stdout, stderr = ssh_client.exec_command(load_command)
-            load_output = stdout.read().decode().strip()
-            if load_output and load_output.replace('.', '').isdigit():
-                metrics['load_average'] = float(load_output)
+            # Run every probe in one exec round trip; each prints a
+            # metric=value line so results are matched by name, not position
+            command = '; '.join(f'echo "{metric}=$({probe})"' for metric, probe, _ in SYSTEM_METRIC_COMMANDS)
+            stdin, stdout, stderr = ssh_client.exec_command(command, timeout=self.ping_timeout)
+            output = dict(
+                line.split('=', 1)
+                for line in stdout.read().decode().splitlines()
+                if '=' in line
+            )
             
-            ssh_client.close()
+            metrics = {}
+            for metric, _, cast in SYSTEM_METRIC_COMMANDS:
+                try:
+                    metrics[metric] = cast(output[metric].strip())
+                except (KeyError, ValueError):
+                    logger.warning(f"Unparseable {metric} probe output from {ip}: {output.get(metric)!r}")
             
             return metrics
             
         except Exception as e:
-            logger.warning(f"Failed to get system metrics for {server.alias}: {str(e)}")
+            logger.warning(f"Failed to get system metrics for {ip}: {str(e)}")
             return {
                 'error_message': f"System metrics error: {str(e)}"
             }
+        
+        finally:
+            ssh_client.close()
     
     def _generate_health_summary(self, health_metric: HealthMetric) -> Dict:
         """
@@ -300,7 +341,7 @@ class HealthService:
             Dict containing health history and summary
         """
         try:
-            server = Server.query.get(server_id)
+            server = db.session.get(Server, server_id)
             if not server:
                 raise ValueError(f"Server with ID {server_id} not found")
             
@@ -348,32 +389,40 @@ class HealthService:
                     }
                 }
             
+            # Start every server's network probes up front so they overlap;
+            # results are recorded from this thread, which owns the session
+            probes = [
+                (server.id, server.alias, SERVER_CHECK_POOL.submit(self._check_connectivity, server.ip))
+                for server in active_servers
+            ]
+            # Don't hold the server list's read transaction open while waiting
+            db.session.commit()
+            
             results = []
-            for server in active_servers:
-                result = self.check_server_health(server.id, detailed=False)
+            for server_id, server_alias, probe in probes:
+                result = self.check_server_health(server_id, detailed=False, connectivity=probe)
                 results.append({
-                    'server_id': server.id,
-                    'server_alias': server.alias,
+                    'server_id': server_id,
+                    'server_alias': server_alias,
                     'result': result
                 })
             
             # Calculate summary statistics
             total_servers = len(results)
-            healthy_servers = sum(1 for r in results if r['result'].get('success') and 
-                                r['result'].get('data', {}).get('health_metric', {}).get('status') == 'healthy')
-            warning_servers = sum(1 for r in results if r['result'].get('success') and 
-                                r['result'].get('data', {}).get('health_metric', {}).get('status') == 'warning')
-            critical_servers = sum(1 for r in results if not r['result'].get('success') or 
-                                 r['result'].get('data', {}).get('health_metric', {}).get('status') == 'critical')
+            # Tally statuses in one pass; failed checks count as critical
+            status_counts = Counter(
+                r['result']['data']['health_metric']['status'] if r['result']['success'] else 'critical'
+                for r in results
+            )
             
             return {
                 'success': True,
                 'message': f'Health check completed for {total_servers} servers',
                 'data': {
                     'total_servers': total_servers,
-                    'healthy_servers': healthy_servers,
-                    'warning_servers': warning_servers,
-                    'critical_servers': critical_servers,
+                    'healthy_servers': status_counts['healthy'],
+                    'warning_servers': status_counts['warning'],
+                    'critical_servers': status_counts['critical'],
                     'results': results
                 }
             }
@@ -385,3 +434,50 @@ class HealthService:
                 'message': f"Failed to check servers health: {str(e)}",
                 'data': None
             }
+    
+    @classmethod
+    def get_system_health(cls) -> Dict:
+        """
+        Get resource usage of the host running the backend
+        
+        The snapshot is reused for SYSTEM_SNAPSHOT_TTL seconds so polling
+        dashboards don't re-read /proc on every request.
+        
+        Returns:
+            Dict containing CPU, memory and disk usage
+        """
+        now = time.monotonic()
+        if cls._system_snapshot is not None and now - cls._system_snapshot_at < cls.system_snapshot_ttl:
+            return cls._system_snapshot
+        
+        try:
+            # Non-blocking CPU sample; memory and disk are each read once
+            cpu_usage = psutil.cpu_percent(interval=None)
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
+            
+            cls._system_snapshot = {
+                'success': True,
+                'message': 'System health retrieved successfully',
+                'data': {
+                    **SYSTEM_INFO,
+                    'cpu_usage': cpu_usage,
+                    'memory_usage': memory.percent,
+                    'memory_total': memory.total,
+                    'memory_available': memory.available,
+                    'disk_usage': disk.percent,
+                    'disk_total': disk.total,
+                    'disk_free': disk.free,
+                    'timestamp': datetime.now(timezone.utc).isoformat()
+                }
+            }
+            cls._system_snapshot_at = now
+            return cls._system_snapshot
+            
+        except Exception as e:
+            logger.error(f"Failed to get system health: {str(e)}")
+            return {
+                'success': False,
+                'message': f"Failed to get system health: {str(e)}",
+                'data': None
+            }
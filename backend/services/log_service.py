@@ -2,7 +2,9 @@
 Log management service for handling deployment and application logs
 """
 import os
-import glob
+import fnmatch
+import heapq
+import math
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional
 from loguru import logger
@@ -11,6 +13,9 @@ from models import db
 from models.deploy_log import DeployLog
 from models.server import Server
 
+# Upper bound on a single page of log files
+MAX_FILE_LOGS_LIMIT = 500
+
 
 class LogService:
     """Service for managing and retrieving logs"""
@@ -40,7 +45,7 @@ class LogService:
             Dict containing filtered deployment logs
         """
         try:
-            query = DeployLog.query
+            query = DeployLog.query_with_relations()
             
             # Apply filters
             if server_id:
@@ -95,7 +100,7 @@ class LogService:
             Dict containing detailed log information
         """
         try:
-            deploy_log = DeployLog.query.get(log_id)
+            deploy_log = db.session.get(DeployLog, log_id)
             if not deploy_log:
                 raise ValueError(f"Deployment log with ID {log_id} not found")
             
@@ -114,18 +119,28 @@ class LogService:
             }
     
     def get_file_logs(self, server_ip: Optional[str] = None, 
-                     date_filter: Optional[str] = None) -> Dict:
+                     date_filter: Optional[str] = None,
+                     limit: Optional[int] = None, offset: int = 0) -> Dict:
         """
-        Get log files from the filesystem
+        Get log files from the filesystem, newest first
         
         Args:
             server_ip: Filter by server IP
             date_filter: Filter by date (YYYY-MM-DD format)
+            limit: Maximum number of files to return (all when None,
+                capped at MAX_FILE_LOGS_LIMIT)
+            offset: Number of newest files to skip
             
         Returns:
             Dict containing file-based logs
         """
         try:
+            # Clamp paging arguments so a negative offset cannot wrap around
+            # and a huge limit cannot pull every file into one response
+            offset = max(0, int(offset or 0))
+            if limit is not None:
+                limit = min(max(0, int(limit)), MAX_FILE_LOGS_LIMIT)
+            
             # Build file pattern
             if server_ip and date_filter:
                 pattern = f"{server_ip}-{date_filter}*.log"
@@ -136,16 +151,29 @@ class LogService:
             else:
                 pattern = "*.log"
             
-            # Find matching log files
-            log_files = glob.glob(os.path.join(self.log_directory, pattern))
-            log_files.sort(key=os.path.getmtime, reverse=True)  # Sort by modification time
+            # Find matching log files in a single directory scan, keeping
+            # each entry's stat result for sorting and output
+            log_files = []
+            if os.path.isdir(self.log_directory):
+                with os.scandir(self.log_directory) as entries:
+                    for entry in entries:
+                        if (not entry.name.startswith('.') and fnmatch.fnmatchcase(entry.name, pattern)
+                                and entry.is_file()):
+                            log_files.append((entry, entry.stat()))
+            total_count = len(log_files)
+            
+            # Sort by modification time; only the requested page is fully sorted
+            by_mtime = lambda item: item[1].st_mtime
+            if limit is None:
+                page = sorted(log_files, key=by_mtime, reverse=True)[offset:]
+            else:
+                page = heapq.nlargest(offset + limit, log_files, key=by_mtime)[offset:]
             
             files_info = []
-            for log_file in log_files:
-                file_stat = os.stat(log_file)
+            for entry, file_stat in page:
                 files_info.append({
-                    'filename': os.path.basename(log_file),
-                    'filepath': log_file,
+                    'filename': entry.name,
+                    'filepath': entry.path,
                     'size': file_stat.st_size,
                     'size_formatted': self._format_file_size(file_stat.st_size),
                     'modified_at': datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc).isoformat(),
@@ -154,14 +182,16 @@ class LogService:
             
             return {
                 'success': True,
-                'message': f'Found {len(files_info)} log files',
+                'message': f'Found {total_count} log files',
                 'data': {
                     'files': files_info,
-                    'total_count': len(files_info),
+                    'total_count': total_count,
                     'log_directory': self.log_directory,
                     'filters_applied': {
                         'server_ip': server_ip,
-                        'date_filter': date_filter
+                        'date_filter': date_filter,
+                        'limit': limit,
+                        'offset': offset
                     }
                 }
             }
@@ -250,7 +280,7 @@ class LogService:
             Dict containing search results
         """
         try:
-            query = DeployLog.query
+            query = DeployLog.query_with_relations()
             
             if server_id:
                 query = query.filter_by(server_id=server_id)
@@ -316,43 +346,45 @@ class LogService:
         try:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
             
-            # Find old database logs
+            # Old database logs are counted and deleted set-wise, never loaded
             old_db_logs = DeployLog.query.filter(
                 DeployLog.created_at < cutoff_date
-            ).all()
+            )
             
-            # Find old log files
+            # Find old log files in a single directory scan, comparing raw
+            # mtimes and only building datetimes for the files kept
+            cutoff_timestamp = cutoff_date.timestamp()
             old_files = []
-            for log_file in glob.glob(os.path.join(self.log_directory, "*.log")):
-                file_stat = os.stat(log_file)
-                file_date = datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc)
-                if file_date < cutoff_date:
-                    old_files.append({
-                        'filename': os.path.basename(log_file),
-                        'filepath': log_file,
-                        'size': file_stat.st_size,
-                        'modified_at': file_date.isoformat()
-                    })
+            if os.path.isdir(self.log_directory):
+                with os.scandir(self.log_directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.') or not entry.name.endswith('.log') or not entry.is_file():
+                            continue
+                        file_stat = entry.stat()
+                        if file_stat.st_mtime < cutoff_timestamp:
+                            old_files.append({
+                                'filename': entry.name,
+                                'filepath': entry.path,
+                                'size': file_stat.st_size,
+                                'modified_at': datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc).isoformat()
+                            })
             
             if dry_run:
+                old_db_count = old_db_logs.count()
                 return {
                     'success': True,
-                    'message': f'Dry run: Would delete {len(old_db_logs)} database logs and {len(old_files)} files',
+                    'message': f'Dry run: Would delete {old_db_count} database logs and {len(old_files)} files',
                     'data': {
                         'cutoff_date': cutoff_date.isoformat(),
                         'retention_days': self.retention_days,
-                        'old_database_logs': len(old_db_logs),
+                        'old_database_logs': old_db_count,
                         'old_files': old_files,
                         'dry_run': True
                     }
                 }
             
-            # Delete old database logs
-            deleted_db_count = 0
-            for log in old_db_logs:
-                db.session.delete(log)
-                deleted_db_count += 1
-            
+            # Delete old database logs in a single statement
+            deleted_db_count = old_db_logs.delete(synchronize_session=False)
             db.session.commit()
             
             # Delete old files
@@ -388,7 +420,7 @@ class LogService:
         """Read last N lines from a file efficiently"""
         # Simple implementation - for large files, consider using more efficient algorithms
         content = file_obj.read().split('\n')
-        return content[-lines:] if len(content) >= lines else content
+        return content[-lines:]
     
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format"""
@@ -396,7 +428,6 @@ class LogService:
             return "0 B"
         
         size_names = ["B", "KB", "MB", "GB", "TB"]
-        import math
         i = int(math.floor(math.log(size_bytes, 1024)))
         p = math.pow(1024, i)
         s = round(size_bytes / p, 2)
@@ -1,16 +1,27 @@
 """
 Server management service for CRUD operations on servers
 """
+import ipaddress
+import os
 import re
+import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from loguru import logger
+from sqlalchemy.exc import IntegrityError
 
 from models import db
 from models.server import Server
 from models.user import User
 
 
+# Server fields that can be changed through update_server
+UPDATABLE_FIELDS = frozenset((
+    'alias', 'name', 'user', 'script_path', 'ssh_port',
+    'description', 'environment', 'is_active'
+))
+
+
 class ServerService:
     """Service for managing servers"""
     
@@ -19,6 +30,9 @@ class ServerService:
             r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
             r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
         )
+        self.stats_cache_ttl = int(os.getenv('SERVER_STATS_CACHE_TTL', 60))
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
     
     def create_server(self, data: Dict, created_by: Optional[int] = None) -> Dict:
         """
@@ -47,17 +61,7 @@ class ServerService:
             if not isinstance(ssh_port, int) or ssh_port < 1 or ssh_port > 65535:
                 raise ValueError("Invalid SSH port (must be between 1 and 65535)")
             
-            # Check for duplicate IP + port combination
-            existing_server = Server.find_by_ip(data['ip'], ssh_port)
-            if existing_server:
-                raise ValueError(f"Server with IP {data['ip']}:{ssh_port} already exists")
-            
-            # Check for duplicate alias
-            existing_alias = Server.find_by_alias(data['alias'])
-            if existing_alias:
-                raise ValueError(f"Server with alias '{data['alias']}' already exists")
-            
-            # Create server
+            # Create server; duplicates are rejected by the unique constraints
             server = Server.create_server(
                 ip=data['ip'],
                 alias=data['alias'],
@@ -70,7 +74,8 @@ class ServerService:
                 created_by=created_by
             )
             
-            logger.info(f"Server {server.alias} ({server.ip}) created successfully")
+            self._stats_cache = None
+            logger.info("Server {} ({}) created successfully", server.alias, server.ip)
             
             return {
                 'success': True,
@@ -78,6 +83,15 @@ class ServerService:
                 'data': server.to_dict()
             }
             
+        except IntegrityError as e:
+            db.session.rollback()
+            message = self._duplicate_message(e, data['ip'], ssh_port, data['alias'])
+            logger.error(f"Failed to create server: {message}")
+            return {
+                'success': False,
+                'message': f"Failed to create server: {message}",
+                'data': None
+            }
         except Exception as e:
             logger.error(f"Failed to create server: {str(e)}")
             return {
@@ -98,7 +112,7 @@ class ServerService:
             Dict containing server data
         """
         try:
-            server = Server.query.get(server_id)
+            server = db.session.get(Server, server_id)
             if not server:
                 raise ValueError(f"Server with ID {server_id} not found")
             
@@ -190,54 +204,32 @@ class ServerService:
             Dict containing update result
         """
         try:
-            server = Server.query.get(server_id)
+            server = db.session.get(Server, server_id)
             if not server:
                 raise ValueError(f"Server with ID {server_id} not found")
             
-            # Fields that can be updated
-            updatable_fields = [
-                'alias', 'name', 'user', 'script_path', 'ssh_port',
-                'description', 'environment', 'is_active'
-            ]
-            
-            # Check for conflicts before updating
             if 'ip' in data and data['ip'] != server.ip:
                 # Validate new IP
                 if not self._is_valid_ip(data['ip']):
                     raise ValueError("Invalid IP address format")
                 
-                # Check for duplicate
-                ssh_port = data.get('ssh_port', server.ssh_port)
-                existing_server = Server.find_by_ip(data['ip'], ssh_port)
-                if existing_server and existing_server.id != server.id:
-                    raise ValueError(f"Server with IP {data['ip']}:{ssh_port} already exists")
-                
                 server.ip = data['ip']
             
-            if 'alias' in data and data['alias'] != server.alias:
-                # Check for duplicate alias
-                existing_alias = Server.find_by_alias(data['alias'])
-                if existing_alias and existing_alias.id != server.id:
-                    raise ValueError(f"Server with alias '{data['alias']}' already exists")
-                
-                server.alias = data['alias']
-            
-            # Update other fields
-            for field in updatable_fields:
-                if field in data:
-                    setattr(server, field, data[field])
+            # Update other fields; duplicate ip:port or alias is rejected on commit
+            for field in UPDATABLE_FIELDS.intersection(data):
+                setattr(server, field, data[field])
             
             # Validate SSH port if updated
-            if hasattr(server, 'ssh_port'):
-                if not isinstance(server.ssh_port, int) or server.ssh_port < 1 or server.ssh_port > 65535:
-                    raise ValueError("Invalid SSH port (must be between 1 and 65535)")
+            if not isinstance(server.ssh_port, int) or server.ssh_port < 1 or server.ssh_port > 65535:
+                raise ValueError("Invalid SSH port (must be between 1 and 65535)")
             
             # Update timestamp
             server.updated_at = datetime.now(timezone.utc)
             
             db.session.commit()
             
-            logger.info(f"Server {server.alias} updated successfully")
+            self._stats_cache = None
+            logger.info("Server {} updated successfully", server.alias)
             
             return {
                 'success': True,
@@ -245,6 +237,15 @@ class ServerService:
                 'data': server.to_dict()
             }
             
+        except IntegrityError as e:
+            message = self._duplicate_message(e, server.ip, server.ssh_port, server.alias)
+            db.session.rollback()
+            logger.error(f"Failed to update server {server_id}: {message}")
+            return {
+                'success': False,
+                'message': f"Failed to update server: {message}",
+                'data': None
+            }
         except Exception as e:
             db.session.rollback()
             logger.error(f"Failed to update server {server_id}: {str(e)}")
@@ -266,10 +267,18 @@ class ServerService:
             Dict containing deletion result
         """
         try:
-            server = Server.query.get(server_id)
+            server = db.session.get(Server, server_id)
             if not server:
                 raise ValueError(f"Server with ID {server_id} not found")
             
+            # Already soft-deleted; nothing to write
+            if not server.is_active:
+                return {
+                    'success': True,
+                    'message': 'Server already deleted',
+                    'data': server.to_dict()
+                }
+            
             # Check if server is currently deploying
             if server.is_deploying():
                 raise ValueError("Cannot delete server while deployment is in progress")
@@ -280,7 +289,8 @@ class ServerService:
             
             db.session.commit()
             
-            logger.info(f"Server {server.alias} ({server.ip}) deleted successfully")
+            self._stats_cache = None
+            logger.info("Server {} ({}) deleted successfully", server.alias, server.ip)
             
             return {
                 'success': True,
@@ -301,27 +311,40 @@ class ServerService:
         """
         Get server statistics and summary
         
+        Status counts are read on every call, since deployments and health
+        checks change them through the model. Only the environment
+        distribution is cached in-process, for SERVER_STATS_CACHE_TTL seconds,
+        and it is dropped whenever this service creates, updates or deletes
+        a server.
+        
         Returns:
             Dict containing server statistics
         """
         try:
-            total_servers = Server.query.count()
-            active_servers = Server.query.filter_by(is_active=True).count()
+            # Totals and status distribution in a single scan
+            active = Server.is_active.is_(True)
+            counts = db.session.query(
+                db.func.count(Server.id),
+                db.func.count(Server.id).filter(active),
+                db.func.count(Server.id).filter(active, Server.status == 'online'),
+                db.func.count(Server.id).filter(active, Server.status == 'offline'),
+                db.func.count(Server.id).filter(active, Server.status == 'deploying'),
+                db.func.count(Server.id).filter(active, Server.status == 'error')
+            ).one()
+            (total_servers, active_servers, online_servers,
+             offline_servers, deploying_servers, error_servers) = counts
             inactive_servers = total_servers - active_servers
             
-            # Count by status
-            online_servers = Server.query.filter_by(status='online', is_active=True).count()
-            offline_servers = Server.query.filter_by(status='offline', is_active=True).count()
-            deploying_servers = Server.query.filter_by(status='deploying', is_active=True).count()
-            error_servers = Server.query.filter_by(status='error', is_active=True).count()
-            
             # Count by environment
-            environments = db.session.query(
-                Server.environment,
-                db.func.count(Server.id).label('count')
-            ).filter_by(is_active=True).group_by(Server.environment).all()
-            
-            environment_stats = {env: count for env, count in environments}
+            now = time.monotonic()
+            if self._stats_cache is None or now - self._stats_cached_at >= self.stats_cache_ttl:
+                environments = db.session.query(
+                    Server.environment,
+                    db.func.count(Server.id).label('count')
+                ).filter_by(is_active=True).group_by(Server.environment).all()
+                
+                self._stats_cache = {env: count for env, count in environments}
+                self._stats_cached_at = now
             
             return {
                 'success': True,
@@ -336,7 +359,7 @@ class ServerService:
                         'deploying': deploying_servers,
                         'error': error_servers
                     },
-                    'environment_distribution': environment_stats,
+                    'environment_distribution': dict(self._stats_cache),
                     'health_percentage': round((online_servers / active_servers * 100) if active_servers > 0 else 0, 2)
                 }
             }
@@ -409,6 +432,20 @@ class ServerService:
                 'data': None
             }
     
+    def _duplicate_message(self, error: IntegrityError, ip: str, ssh_port: int, alias: str) -> str:
+        """Map a unique constraint violation on servers to a readable message
+        
+        Other integrity errors (foreign keys, NOT NULL) are reported as such
+        rather than as duplicates.
+        """
+        diag = getattr(error.orig, 'diag', None)
+        constraint = getattr(diag, 'constraint_name', None) or str(error.orig)
+        if 'unique_server_alias' in constraint:
+            return f"Server with alias '{alias}' already exists"
+        if 'unique_server_endpoint' in constraint:
+            return f"Server with IP {ip}:{ssh_port} already exists"
+        return f"Database integrity error: {error.orig}"
+    
     def _is_valid_ip(self, ip: str) -> bool:
         """
         Validate IP address format
@@ -425,7 +462,6 @@ class ServerService:
                 return True
             
             # Try IPv6 validation
-            import ipaddress
             ipaddress.IPv6Address(ip)
             return True
             
@@ -1,12 +1,17 @@
 import bcrypt
 import jwt
-from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import os
+import time
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY")
+JWT_ALGORITHM = "HS256"
+JWT_ALGORITHMS = (JWT_ALGORITHM,)
+TOKEN_TTL_SECONDS = 3600
+# Claims every accepted token must carry; enforced by jwt.decode itself
+JWT_DECODE_OPTIONS = {"require": ["exp", "sub"]}
 
 if not SECRET_KEY:
     raise RuntimeError("SECRET_KEY is not set in the environment variables")
@@ -23,16 +28,15 @@ def verify_password(password, hashed):
 def generate_token(username):
     payload = {
         "sub": username,
-        "exp": datetime.utcnow() + timedelta(hours=1)
+        "exp": int(time.time()) + TOKEN_TTL_SECONDS
     }
-    token = jwt.encode(payload, SECRET_KEY, algorithm="HS256")
-    print(f"Generated token for {username}: {token}")  # Log the token
+    token = jwt.encode(payload, SECRET_KEY, algorithm=JWT_ALGORITHM)
     return token
 
 # Verify JWT token
 def verify_token(token):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=JWT_ALGORITHMS, options=JWT_DECODE_OPTIONS)
         return payload["sub"]
     except jwt.ExpiredSignatureError:
         return None
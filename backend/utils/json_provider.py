@@ -0,0 +1,30 @@
+"""
+Flask JSON provider backed by orjson
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson
+
+    Datetimes are passed through to Flask's default handler so responses keep
+    the same format as with the stdlib provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        # Pretty-printed (debug) responses keep using the stdlib encoder
+        if kwargs.get('indent') is not None:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)